@@ -0,0 +1,86 @@
+"""Compare serial and parallel ICS parsing to find the crossover point.
+
+Usage: uv run python benchmarks/bench_parse.py [WORKERS]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from ical_events import calendar
+from ical_events.calendar import parse_events
+from ical_events.models import FiltersConfig
+
+SIZES = [250, 500, 1000, 2000, 4000, 8000, 16000]
+
+VTIMEZONE = """BEGIN:VTIMEZONE
+TZID:America/Los_Angeles
+BEGIN:DAYLIGHT
+TZOFFSETFROM:-0800
+TZOFFSETTO:-0700
+DTSTART:20070311T020000
+RRULE:FREQ=YEARLY;BYMONTH=3;BYDAY=2SU
+TZNAME:PDT
+END:DAYLIGHT
+BEGIN:STANDARD
+TZOFFSETFROM:-0700
+TZOFFSETTO:-0800
+DTSTART:20071104T020000
+RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU
+TZNAME:PST
+END:STANDARD
+END:VTIMEZONE"""
+
+
+def synthetic_ics(n: int) -> str:
+    lines = ["BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//bench//EN", VTIMEZONE]
+    start = date(2026, 1, 1)
+    for i in range(n):
+        day = start + timedelta(days=i % 365)
+        lines.append("BEGIN:VEVENT")
+        lines.append(f"UID:bench-{i}@example.com")
+        lines.append("DTSTAMP:20260101T000000Z")
+        if i % 2:
+            lines.append(f"DTSTART;VALUE=DATE:{day:%Y%m%d}")
+            lines.append(f"DTEND;VALUE=DATE:{day + timedelta(days=1):%Y%m%d}")
+        else:
+            dt = datetime.combine(day, datetime.min.time()) + timedelta(hours=18)
+            lines.append(f"DTSTART;TZID=America/Los_Angeles:{dt:%Y%m%dT%H%M%S}")
+            lines.append(
+                f"DTEND;TZID=America/Los_Angeles:{dt + timedelta(hours=2):%Y%m%dT%H%M%S}"
+            )
+        lines.append(f"SUMMARY:Benchmark Event {i}")
+        lines.append(f"DESCRIPTION:Synthetic event number {i} for parse timing.")
+        lines.append("LOCATION:Los Angeles, CA")
+        lines.append("CATEGORIES:Bench,Tech")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+    return "\r\n".join(lines) + "\r\n"
+
+
+def _time(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+
+def main() -> None:
+    workers = int(sys.argv[1]) if len(sys.argv) > 1 else (os.cpu_count() or 2)
+    filters = FiltersConfig(start_date=date(2026, 1, 1), end_date=date(2026, 12, 31))
+    # Force the parallel path at every size so the crossover is visible
+    calendar.PARALLEL_MIN_EVENTS = 0
+
+    print(f"workers: {workers} (PARALLEL_MIN_EVENTS default is 2000)")
+    print(f"{'events':>8} {'serial':>10} {'parallel':>10} {'speedup':>8}")
+    for n in SIZES:
+        ics = synthetic_ics(n)
+        serial = _time(lambda: parse_events(ics, filters))
+        parallel = _time(lambda: parse_events(ics, filters, workers=workers))
+        print(f"{n:>8} {serial:>9.3f}s {parallel:>9.3f}s {serial / parallel:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Measure search index size and query latency on a synthetic listing.
+
+Query latency is measured for the Python reference ``search_index`` and,
+when ``node`` is on PATH, for the shipped ``search.js`` against the same
+generated index.
+
+Usage: uv run python benchmarks/bench_search.py [N_EVENTS]
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import ical_events
+from ical_events.models import TemplateEvent
+from ical_events.search import build_search_index, search_index
+
+WORDS = (
+    "python rust javascript cloud data machine learning security devops "
+    "startup founder design product mobile web api database kubernetes "
+    "meetup conference workshop hackathon summit panel keynote networking "
+    "beginner advanced community open source ai robotics hardware gaming"
+).split()
+SYLLABLES = "ka ri to ne su mi la po ve da zu ho bi ter lon fax gul".split()
+CITIES = ["Los Angeles", "Pasadena", "Santa Monica", "Irvine", "Burbank", "Long Beach"]
+QUERIES = ["py", "rust conf", "los angeles", "open source meetup", "k", "zzz"]
+SEARCH_JS = Path(ical_events.__file__).parent / "templates" / "scripts" / "search.js"
+
+# Loads search.js against a stub DOM and drives it through its input
+# handler, as the page does, so the timings cover the shipped code path
+NODE_HARNESS = r"""
+const fs = require('fs');
+const [indexPath, scriptPath, total, ...queries] = process.argv.slice(2);
+const indexJson = fs.readFileSync(indexPath, 'utf8');
+let onInput = null;
+const input = { value: '', addEventListener: (type, fn) => { onInput = fn; } };
+globalThis.window = globalThis;
+globalThis.document = {
+  readyState: 'complete',
+  getElementById: () => ({ textContent: indexJson }),
+  querySelector: () => input,
+  querySelectorAll: () => ({ length: Number(total) }),
+};
+new Function(fs.readFileSync(scriptPath, 'utf8'))();
+
+function run(query) {
+  input.value = query;
+  onInput();
+  return window.__getSearchMatches();
+}
+
+let t0 = performance.now();
+run('a');
+console.log(`first query incl. index parse: ${(performance.now() - t0).toFixed(1)} ms`);
+for (const query of queries) {
+  const runs = 50;
+  let matches = null;
+  t0 = performance.now();
+  for (let i = 0; i < runs; i++) {
+    matches = run(query);
+  }
+  const ms = (performance.now() - t0) / runs;
+  const hits = matches.reduce((a, b) => a + b, 0);
+  const label = `'${query}'`.padEnd(22);
+  console.log(`query ${label} ${String(hits).padStart(6)} hits  ${ms.toFixed(3)} ms`);
+}
+"""
+
+
+def synthetic_events(n: int) -> list[TemplateEvent]:
+    rng = random.Random(42)
+    start = date(2026, 1, 1)
+    names = ["".join(rng.choices(SYLLABLES, k=3)) for _ in range(3000)]
+    events = []
+    for i in range(n):
+        events.append(
+            TemplateEvent(
+                uid=f"bench-{i}@example.com",
+                summary=" ".join(
+                    rng.choices(WORDS, k=3) + rng.choices(names, k=2)
+                ).title(),
+                description=" ".join(rng.choices(WORDS, k=25)),
+                location=f"{rng.choice(CITIES)}, CA",
+                start_date=start + timedelta(days=i % 365),
+                categories=rng.sample(WORDS, k=2),
+            )
+        )
+    return events
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    events = synthetic_events(n)
+
+    t0 = time.perf_counter()
+    index = build_search_index(events)
+    build_ms = (time.perf_counter() - t0) * 1000
+
+    raw = json.dumps(index, separators=(",", ":")).encode()
+    print(f"events:       {n}")
+    print(f"tokens:       {len(index['tokens'])}")
+    print(f"build:        {build_ms:.1f} ms")
+    print(
+        f"index size:   {len(raw) / 1024:.1f} KiB ({len(gzip.compress(raw)) / 1024:.1f} KiB gzip)"
+    )
+
+    print("search_index (Python reference):")
+    for query in QUERIES:
+        runs = 50
+        t0 = time.perf_counter()
+        for _ in range(runs):
+            hits = search_index(index, query)
+        ms = (time.perf_counter() - t0) * 1000 / runs
+        print(f"query {query!r:22} {len(hits):6d} hits  {ms:.3f} ms")
+
+    node = shutil.which("node")
+    if node is None:
+        print("node not found; skipping search.js timings")
+        return
+    print("search.js (node):")
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = Path(tmp) / "index.json"
+        index_path.write_bytes(raw)
+        subprocess.run(
+            [node, "-", str(index_path), str(SEARCH_JS), str(n), *QUERIES],
+            input=NODE_HARNESS,
+            text=True,
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -3,13 +3,21 @@
 from __future__ import annotations
 
 import hashlib
+import heapq
+import re
 import sys
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime, timedelta
+from itertools import repeat
 
 import requests
 from ical.calendar_stream import IcsCalendarStream
+from ical.event import Event
 
+from .dates import format_date_display, get_zone, month_key, to_zone
 from .models import FiltersConfig, TemplateEvent
+from .rules import compile_rules
 
 
 def fetch_calendar_data(source: str) -> str:
@@ -41,42 +49,42 @@ def _make_anchor_id(uid: str) -> str:
     return hashlib.md5(uid.encode()).hexdigest()[:8]
 
 
-def _format_date_display(start: date, end: date | None) -> str:
-    """Format a human-readable date display string."""
-    fmt = "%b %d, %Y"
-    start_str = start.strftime(fmt)
+_LINE_BREAK_RE = re.compile(r"\r\n|\n|\r")
 
-    if end and end != start:
-        if start.year == end.year and start.month == end.month:
-            return f"{start.strftime('%b %d')}–{end.strftime('%d, %Y')}"
-        elif start.year == end.year:
-            return f"{start.strftime('%b %d')}–{end.strftime('%b %d, %Y')}"
-        else:
-            return f"{start_str}–{end.strftime(fmt)}"
-
-    return start_str
+PARALLEL_MIN_EVENTS = 2000
+"""Below this many VEVENTs the process pool costs more than it saves."""
 
 
-def parse_events(ics_content: str, filters: FiltersConfig) -> list[TemplateEvent]:
-    """Parse ICS content and return filtered, sorted TemplateEvent list."""
-    try:
-        calendars = IcsCalendarStream.calendar_from_ics(ics_content)
-    except Exception as e:
-        print(f"Error: Failed to parse calendar data: {e}", file=sys.stderr)
-        sys.exit(2)
+def _to_template_events(
+    calendar_events: Iterable[Event],
+    filters: FiltersConfig,
+    timezone: str | None = None,
+) -> list[TemplateEvent]:
+    """Convert parsed ICS events to TemplateEvents, applying all filters.
 
+    Timed events are converted to ``timezone`` when given, so dates and
+    month grouping reflect the site's local calendar.
+    """
     start_filter = filters.start_date
     end_filter = filters.effective_end_date()
+    zone = get_zone(timezone) if timezone else None
+    matcher = compile_rules(filters)
 
     events: list[TemplateEvent] = []
 
-    for event in calendars.events:
+    for event in calendar_events:
         dtstart = event.dtstart
-        dtend = event.dtend
+        # An event gives either DTEND or DURATION; the library resolves the
+        # latter into an end, which is what display and ends_at need
+        dtend = event.dtend if event.duration is None else event.end
 
         if dtstart is None:
             continue
 
+        # Rules run on the raw fields so rejected events skip all conversion
+        if matcher is not None and not matcher.accepts(event):
+            continue
+
         is_all_day = not isinstance(dtstart, datetime)
 
         if is_all_day:
@@ -91,10 +99,10 @@ def parse_events(ics_content: str, filters: FiltersConfig) -> list[TemplateEvent
             start_dt = None
             end_dt = None
         else:
-            event_start_date = dtstart.date()
-            event_end_date = dtend.date() if dtend else event_start_date
-            start_dt = dtstart
-            end_dt = dtend
+            start_dt = to_zone(dtstart, zone)
+            end_dt = to_zone(dtend, zone) if isinstance(dtend, datetime) else None
+            event_start_date = start_dt.date()
+            event_end_date = end_dt.date() if end_dt else event_start_date
 
         # Apply date filters
         if event_start_date > end_filter:
@@ -121,9 +129,9 @@ def parse_events(ics_content: str, filters: FiltersConfig) -> list[TemplateEvent
             end_datetime=end_dt,
             is_all_day=is_all_day,
             categories=categories,
-            month_key=event_start_date.strftime("%Y-%m"),
+            month_key=month_key(event_start_date),
             anchor_id=_make_anchor_id(uid),
-            date_display=_format_date_display(
+            date_display=format_date_display(
                 event_start_date,
                 event_end_date if event_end_date != event_start_date else None,
             ),
@@ -131,8 +139,132 @@ def parse_events(ics_content: str, filters: FiltersConfig) -> list[TemplateEvent
         )
         events.append(te)
 
-    # Sort chronologically
-    events.sort(key=lambda e: (e.start_date, e.summary))
+    return events
+
+
+def _sort_key(event: TemplateEvent) -> tuple[date, str]:
+    return (event.start_date, event.summary)
+
+
+def _split_vevents(ics_content: str) -> tuple[list[str], list[str]] | None:
+    """Split a VCALENDAR into its shared lines and individual VEVENT blocks.
+
+    Shared lines are the calendar properties plus every non-VEVENT component
+    (notably VTIMEZONE), which each chunk needs to resolve TZID references.
+    Returns None if the content isn't a single VCALENDAR.
+    """
+    # Only CR/LF end ICS lines; str.splitlines() would also break on NEL,
+    # U+2028 and friends, which can appear inside property values
+    lines = _LINE_BREAK_RE.split(ics_content.lstrip("\ufeff\r\n"))
+    if not lines or lines[0].strip().upper() != "BEGIN:VCALENDAR":
+        return None
+
+    shared: list[str] = []
+    vevents: list[str] = []
+    current: list[str] | None = None
+    depth = 0
+
+    for n, line in enumerate(lines[1:], start=1):
+        upper = line.upper()
+        if upper.startswith("BEGIN:"):
+            depth += 1
+            if depth == 1 and upper.rstrip() == "BEGIN:VEVENT":
+                current = []
+        elif upper.startswith("END:"):
+            if depth == 0:
+                # Anything after END:VCALENDAR would be a second calendar
+                if upper.rstrip() != "END:VCALENDAR":
+                    return None
+                if any(rest.strip() for rest in lines[n + 1 :]):
+                    return None
+                return shared, vevents
+            depth -= 1
+            if depth == 0 and current is not None:
+                current.append(line)
+                vevents.append("\r\n".join(current))
+                current = None
+                continue
+
+        if current is not None:
+            current.append(line)
+        elif line.strip():
+            shared.append(line)
+
+    return None
+
+
+def _parse_chunk(
+    chunk: str, filters: FiltersConfig, timezone: str | None
+) -> list[TemplateEvent]:
+    """Parse one VCALENDAR chunk in a worker process."""
+    calendar = IcsCalendarStream.calendar_from_ics(chunk)
+    events = _to_template_events(calendar.events, filters, timezone)
+    events.sort(key=_sort_key)
+    return events
+
+
+def _parse_parallel(
+    ics_content: str, filters: FiltersConfig, workers: int, timezone: str | None
+) -> list[TemplateEvent] | None:
+    """Parse VEVENT chunks across a process pool.
+
+    Returns None when the input is too small or can't be split, so the
+    caller falls back to the serial path.
+    """
+    split = _split_vevents(ics_content)
+    if split is None:
+        return None
+    shared, vevents = split
+    if len(vevents) < PARALLEL_MIN_EVENTS:
+        return None
+
+    header = "\r\n".join(["BEGIN:VCALENDAR", *shared])
+    size = -(-len(vevents) // workers)
+    chunks = [
+        "\r\n".join([header, *vevents[i : i + size], "END:VCALENDAR", ""])
+        for i in range(0, len(vevents), size)
+    ]
+
+    try:
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            results = list(
+                pool.map(_parse_chunk, chunks, repeat(filters), repeat(timezone))
+            )
+    except Exception as e:
+        print(f"Error: Failed to parse calendar data: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    # Chunks are contiguous, so a stable merge matches the serial sort order
+    return list(heapq.merge(*results, key=_sort_key))
+
+
+def parse_events(
+    ics_content: str,
+    filters: FiltersConfig,
+    workers: int = 1,
+    timezone: str | None = None,
+) -> list[TemplateEvent]:
+    """Parse ICS content and return filtered, sorted TemplateEvent list.
+
+    With ``workers`` > 1, large calendars are parsed in parallel across
+    that many processes. ``timezone`` is an IANA name that timed events
+    are displayed in; by default each keeps the zone its feed used.
+    """
+    events = None
+    if workers > 1:
+        events = _parse_parallel(ics_content, filters, workers, timezone)
+
+    if events is None:
+        try:
+            calendars = IcsCalendarStream.calendar_from_ics(ics_content)
+        except Exception as e:
+            print(f"Error: Failed to parse calendar data: {e}", file=sys.stderr)
+            sys.exit(2)
+
+        events = _to_template_events(calendars.events, filters, timezone)
+
+        # Sort chronologically
+        events.sort(key=_sort_key)
 
     # Apply max_events limit
     if filters.max_events is not None:
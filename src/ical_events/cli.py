@@ -10,13 +10,110 @@ from pathlib import Path
 from . import __version__
 from .calendar import fetch_calendar_data, parse_events
 from .config import load_config
-from .generator import generate_html, write_output
+from .generator import (
+    SERVICE_WORKER_FILE,
+    compute_valid_until,
+    generate_html,
+    generate_service_worker,
+    write_output,
+)
+from .links import check_event_links
+from .server import SiteServer
+
+
+def serve(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ical-events serve",
+        description="Serve the event listing over HTTP, refreshing it in the background",
+    )
+    parser.add_argument("config", help="Path to YAML configuration file")
+    parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Interface to bind (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to listen on (default: 8000)",
+    )
+    parser.add_argument(
+        "--refresh",
+        type=float,
+        default=3600,
+        metavar="SECONDS",
+        help="Seconds between calendar refreshes (default: 3600)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing large calendars (default: 1)",
+    )
+
+    args = parser.parse_args(argv)
+    config = load_config(args.config)
+
+    site = SiteServer(config, args.host, args.port, args.refresh, args.jobs)
+    host, port = site.address
+    print(
+        f"Serving {site.snapshot.event_count} events at http://{host}:{port}/ "
+        f"(refresh every {args.refresh:g}s)"
+    )
+    try:
+        site.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+def check_links(argv: list[str]) -> None:
+    parser = argparse.ArgumentParser(
+        prog="ical-events check-links",
+        description="Check that every event URL in the calendar still resolves",
+    )
+    parser.add_argument("config", help="Path to YAML configuration file")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing large calendars (default: 1)",
+    )
+
+    args = parser.parse_args(argv)
+    config = load_config(args.config)
+
+    ics_content = fetch_calendar_data(config.calendar)
+    events = parse_events(ics_content, config.filters, args.jobs, config.site.timezone)
+    linked = sum(1 for e in events if e.url)
+    broken = check_event_links(
+        events, config.links.model_copy(update={"drop_broken": False})
+    )
+
+    print(f"Checked {linked} event links: {broken} broken")
+    if broken:
+        sys.exit(6)
 
 
 def main(argv: list[str] | None = None) -> None:
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == "serve":
+        serve(argv[1:])
+        return
+    if argv and argv[0] == "check-links":
+        check_links(argv[1:])
+        return
+
     parser = argparse.ArgumentParser(
         prog="ical-events",
         description="Generate a static HTML event listing from an ICS calendar",
+        epilog=(
+            "Run 'ical-events serve -h' to serve the listing over HTTP instead, "
+            "or 'ical-events check-links -h' to validate event URLs."
+        ),
     )
     parser.add_argument("config", help="Path to YAML configuration file")
     parser.add_argument(
@@ -24,6 +121,13 @@ def main(argv: list[str] | None = None) -> None:
         "--output",
         help="Override output file path",
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for parsing large calendars (default: 1)",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -41,13 +145,17 @@ def main(argv: list[str] | None = None) -> None:
 
     # Fetch and parse calendar
     ics_content = fetch_calendar_data(config.calendar)
-    events = parse_events(ics_content, config.filters)
+    events = parse_events(ics_content, config.filters, args.jobs, config.site.timezone)
 
     if not events:
         print(
             "Warning: No events found matching the configured filters.", file=sys.stderr
         )
 
+    # Validate event URLs if configured
+    if config.links.enabled:
+        check_event_links(events, config.links)
+
     # Generate HTML
     html = generate_html(config, events)
 
@@ -55,6 +163,15 @@ def main(argv: list[str] | None = None) -> None:
     output_path = config.output.file
     write_output(html, output_path)
     print(f"Generated {len(events)} events → {output_path}")
+    valid_until = compute_valid_until(config, events)
+    if valid_until:
+        print(f"Page stays current until {valid_until:%Y-%m-%d %H:%M} UTC")
+
+    # Write service worker alongside the page if enabled
+    if config.output.service_worker:
+        page = Path(output_path)
+        sw = generate_service_worker({page.name: html})
+        write_output(sw, str(page.parent / SERVICE_WORKER_FILE))
 
     # Deploy to Cloudflare Pages if configured
     if config.wrangler_pages_project:
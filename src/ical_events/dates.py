@@ -0,0 +1,58 @@
+"""Memoized timezone lookup and date label formatting."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from functools import lru_cache
+from typing import NamedTuple
+from zoneinfo import ZoneInfo
+
+
+class DateBlock(NamedTuple):
+    """Pre-formatted parts of the date block shown on an event card."""
+
+    month: str
+    day: str
+    year: str
+
+
+@lru_cache(maxsize=None)
+def get_zone(name: str) -> ZoneInfo:
+    """Return the ZoneInfo for an IANA name, raising if it is unknown."""
+    return ZoneInfo(name)
+
+
+def to_zone(moment: datetime, zone: ZoneInfo | None) -> datetime:
+    """Convert an aware datetime to ``zone``; floating times are left as-is."""
+    if zone is None or moment.tzinfo is None:
+        return moment
+    return moment.astimezone(zone)
+
+
+@lru_cache(maxsize=4096)
+def format_date_display(start: date, end: date | None) -> str:
+    """Format a human-readable date display string."""
+    fmt = "%b %d, %Y"
+    start_str = start.strftime(fmt)
+
+    if end and end != start:
+        if start.year == end.year and start.month == end.month:
+            return f"{start.strftime('%b %d')}–{end.strftime('%d, %Y')}"
+        elif start.year == end.year:
+            return f"{start.strftime('%b %d')}–{end.strftime('%b %d, %Y')}"
+        else:
+            return f"{start_str}–{end.strftime(fmt)}"
+
+    return start_str
+
+
+@lru_cache(maxsize=4096)
+def month_key(day: date) -> str:
+    """Return the YYYY-MM key used to group events by month."""
+    return f"{day.year:04d}-{day.month:02d}"
+
+
+@lru_cache(maxsize=4096)
+def date_block(day: date) -> DateBlock:
+    """Return the month abbreviation, day and year labels for a card."""
+    return DateBlock(day.strftime("%b"), str(day.day), str(day.year))
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import sys
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
 from itertools import groupby
 from pathlib import Path
 
 from jinja2 import Environment, PackageLoader, TemplateError
 
 from .models import Config, TemplateEvent
+from .search import build_category_facets, build_search_index
+
+SERVICE_WORKER_FILE = "sw.js"
 
 
 def _build_jsonld(config: Config, events: list[TemplateEvent]) -> str:
@@ -59,6 +63,13 @@ def _build_jsonld(config: Config, events: list[TemplateEvent]) -> str:
     return json.dumps(data, indent=2, ensure_ascii=False)
 
 
+def _script_json(data: object) -> str:
+    """Serialize data compactly for embedding in a ``<script>`` element."""
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).replace(
+        "<", "\\u003c"
+    )
+
+
 def _load_template_file(base_path: Path, *parts: str) -> str:
     """Read a template file from disk."""
     path = base_path.joinpath(*parts)
@@ -75,13 +86,63 @@ def _month_label(month_key: str) -> str:
         return month_key
 
 
+def _utc_instant(moment: datetime, latest: bool) -> datetime:
+    """Pin a possibly floating datetime to a UTC instant.
+
+    Naive datetimes are local to the viewer, so they span UTC-12..UTC+14;
+    ``latest`` picks the last (or first) instant they can correspond to.
+    """
+    if moment.tzinfo is not None:
+        return moment.astimezone(timezone.utc)
+    offset = timedelta(hours=12) if latest else timedelta(hours=-14)
+    return (moment + offset).replace(tzinfo=timezone.utc)
+
+
+def _month_ends(events: list[TemplateEvent]) -> dict[str, str]:
+    """Latest possible end of any event in each month, as a UTC timestamp."""
+    ends: dict[str, datetime] = {}
+    for event in events:
+        end = _utc_instant(event.ends_at, latest=True)
+        if event.month_key not in ends or end > ends[event.month_key]:
+            ends[event.month_key] = end
+    return {key: end.isoformat() for key, end in ends.items()}
+
+
+def compute_valid_until(config: Config, events: list[TemplateEvent]) -> datetime | None:
+    """Return the UTC moment the page stops being correct without a rebuild.
+
+    The page hides finished events by itself, so it only goes stale once
+    every event has ended, or, when ``max_events`` capped the list, once
+    the first shown event ends and a left-out event should take its place.
+    Without an explicit ``end_date`` the window rolls forward every day, so
+    the page is also stale at the next local midnight, when events that
+    were past the old end date become due.
+    """
+    if not events:
+        return None
+    max_events = config.filters.max_events
+    if max_events is not None and len(events) >= max_events:
+        valid_until = min(_utc_instant(e.ends_at, latest=False) for e in events)
+    else:
+        valid_until = max(_utc_instant(e.ends_at, latest=True) for e in events)
+    if config.filters.end_date is None:
+        # Naive, so astimezone() reads it as the build machine's local time
+        tomorrow = datetime.combine(date.today() + timedelta(days=1), time())
+        valid_until = min(valid_until, tomorrow.astimezone(timezone.utc))
+    return valid_until
+
+
+def _environment() -> Environment:
+    return Environment(
+        loader=PackageLoader("ical_events", "templates"),
+        autoescape=True,
+    )
+
+
 def generate_html(config: Config, events: list[TemplateEvent]) -> str:
     """Generate the complete HTML page."""
     try:
-        env = Environment(
-            loader=PackageLoader("ical_events", "templates"),
-            autoescape=True,
-        )
+        env = _environment()
 
         # Load CSS and JS as raw strings
         templates_dir = Path(__file__).parent / "templates"
@@ -94,12 +155,18 @@ def generate_html(config: Config, events: list[TemplateEvent]) -> str:
             css_parts.append(_load_template_file(templates_dir, css_file))
         inline_css = "\n".join(css_parts)
 
-        js_parts = []
-        for js_file in [
+        js_files = [
             "scripts/theme.js",
             "scripts/favorites.js",
+            "scripts/search.js",
+            "scripts/facets.js",
             "scripts/filter.js",
-        ]:
+        ]
+        if config.output.service_worker:
+            js_files.append("scripts/sw_register.js")
+
+        js_parts = []
+        for js_file in js_files:
             js_parts.append(_load_template_file(templates_dir, js_file))
         inline_js = "\n".join(js_parts)
 
@@ -111,6 +178,15 @@ def generate_html(config: Config, events: list[TemplateEvent]) -> str:
         # Build JSON-LD
         jsonld = _build_jsonld(config, events)
 
+        # Build search index
+        search_index = _script_json(build_search_index(events))
+
+        # Build category facets; the client only needs the position lists
+        facets = build_category_facets(events)
+        facet_index = _script_json([facet["ids"] for facet in facets])
+
+        valid_until = compute_valid_until(config, events)
+
         template = env.get_template("base.html.j2")
         html = template.render(
             config=config,
@@ -120,6 +196,11 @@ def generate_html(config: Config, events: list[TemplateEvent]) -> str:
             inline_css=inline_css,
             inline_js=inline_js,
             jsonld=jsonld,
+            search_index=search_index,
+            facets=facets,
+            facet_index=facet_index,
+            month_ends=_month_ends(events),
+            valid_until=valid_until.isoformat() if valid_until else None,
         )
         return html
 
@@ -128,6 +209,33 @@ def generate_html(config: Config, events: list[TemplateEvent]) -> str:
         sys.exit(3)
 
 
+def generate_service_worker(outputs: dict[str, str]) -> str:
+    """Generate a service worker that precaches the given output files.
+
+    ``outputs`` maps file names in the output directory to their contents.
+    The cache name is derived from a hash over all of them, so any change
+    to the build produces a new cache and the old one is removed.
+    """
+    build_hash = hashlib.sha256()
+    for name in sorted(outputs):
+        build_hash.update(name.encode("utf-8") + b"\0")
+        build_hash.update(outputs[name].encode("utf-8") + b"\0")
+
+    precache_urls = [f"./{name}" for name in sorted(outputs)]
+    if "index.html" in outputs:
+        precache_urls.insert(0, "./")
+
+    try:
+        template = _environment().get_template("service_worker.js.j2")
+        return template.render(
+            build_hash=build_hash.hexdigest()[:16],
+            precache_urls=precache_urls,
+        )
+    except TemplateError as e:
+        print(f"Error: Template rendering failed: {e}", file=sys.stderr)
+        sys.exit(3)
+
+
 def write_output(html: str, output_path: str) -> None:
     """Write the generated HTML to disk."""
     try:
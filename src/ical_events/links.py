@@ -0,0 +1,171 @@
+"""Concurrent, cached validation of event URLs."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .models import LinkCheckConfig, TemplateEvent
+
+
+@dataclass(frozen=True, slots=True)
+class LinkResult:
+    """Outcome of checking one URL."""
+
+    ok: bool
+    checked_at: str
+    status: int | None = None
+    error: str | None = None
+
+    def expired(self, settings: LinkCheckConfig, now: datetime) -> bool:
+        hours = settings.ttl_hours if self.ok else settings.broken_ttl_hours
+        try:
+            checked = datetime.fromisoformat(self.checked_at)
+        except ValueError:
+            return True
+        return now - checked >= timedelta(hours=hours)
+
+    def describe(self) -> str:
+        return f"HTTP {self.status}" if self.status is not None else str(self.error)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class _HostLimiter:
+    """Cap concurrent requests per host and space out their start times."""
+
+    def __init__(self, per_host: int, min_interval: float) -> None:
+        self._per_host = per_host
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._slots: dict[str, threading.Semaphore] = {}
+        self._next_start: dict[str, float] = {}
+
+    @contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        with self._lock:
+            sem = self._slots.setdefault(host, threading.Semaphore(self._per_host))
+        with sem:
+            with self._lock:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self._min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def _load_cache(path: Path) -> dict[str, LinkResult]:
+    try:
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return {url: LinkResult(**entry) for url, entry in raw.items()}
+    except OSError, ValueError, TypeError, AttributeError:
+        # Missing or unreadable cache: everything gets re-checked
+        return {}
+
+
+def _save_cache(path: Path, results: dict[str, LinkResult]) -> None:
+    data = {url: asdict(result) for url, result in sorted(results.items())}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        tmp.replace(path)
+    except OSError as e:
+        print(f"Warning: Cannot write link cache: {e}", file=sys.stderr)
+
+
+def _check_url(
+    session: requests.Session, limiter: _HostLimiter, url: str, timeout: float
+) -> LinkResult:
+    try:
+        host = urlsplit(url).netloc.lower()
+        with limiter.slot(host):
+            resp = session.head(url, timeout=timeout, allow_redirects=True)
+            if resp.status_code >= 400:
+                # Many servers reject or mishandle HEAD; confirm with GET
+                resp = session.get(
+                    url, timeout=timeout, allow_redirects=True, stream=True
+                )
+                resp.close()
+    except (requests.RequestException, ValueError) as e:
+        # Malformed URLs surface as ValueError, from urlsplit or as urllib3's
+        # unwrapped LocationParseError, and count as broken like any other
+        error = e.__class__.__name__
+        return LinkResult(ok=False, checked_at=_now().isoformat(), error=error)
+    return LinkResult(
+        ok=resp.status_code < 400,
+        checked_at=_now().isoformat(),
+        status=resp.status_code,
+    )
+
+
+def check_links(urls: list[str], settings: LinkCheckConfig) -> dict[str, LinkResult]:
+    """Check each http(s) URL, reusing cached results that haven't expired.
+
+    Only new or expired URLs hit the network. They are checked
+    concurrently over a pooled session, limited per host, with HEAD first
+    and GET as a fallback. The cache file is updated afterwards.
+    """
+    cache_path = Path(settings.cache_file)
+    cache = _load_cache(cache_path)
+    now = _now()
+    cache = {url: r for url, r in cache.items() if not r.expired(settings, now)}
+
+    wanted = [u for u in dict.fromkeys(urls) if u.startswith(("http://", "https://"))]
+    pending = [u for u in wanted if u not in cache]
+
+    if pending:
+        limiter = _HostLimiter(settings.per_host, settings.min_interval)
+        adapter = HTTPAdapter(
+            pool_connections=settings.concurrency, pool_maxsize=settings.concurrency
+        )
+        with requests.Session() as session:
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.headers["User-Agent"] = "ical-events-link-checker"
+            with ThreadPoolExecutor(max_workers=settings.concurrency) as pool:
+                checked = pool.map(
+                    lambda u: _check_url(session, limiter, u, settings.timeout),
+                    pending,
+                )
+                cache.update(zip(pending, checked))
+
+    _save_cache(cache_path, cache)
+    return {url: cache[url] for url in wanted}
+
+
+def check_event_links(events: list[TemplateEvent], settings: LinkCheckConfig) -> int:
+    """Check event URLs, report broken ones and optionally drop them.
+
+    Returns the number of events with a broken link.
+    """
+    results = check_links([e.url for e in events if e.url], settings)
+    broken = 0
+    for event in events:
+        result = results.get(event.url) if event.url else None
+        if result is None or result.ok:
+            continue
+        broken += 1
+        print(
+            f'Warning: Broken link in "{event.summary}": {event.url} '
+            f"({result.describe()})",
+            file=sys.stderr,
+        )
+        if settings.drop_broken:
+            event.url = None
+    return broken
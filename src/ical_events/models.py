@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import date, datetime
-from pydantic import BaseModel, Field
+import re
+from datetime import date, datetime, time, timedelta
+from zoneinfo import ZoneInfoNotFoundError
+
+from pydantic import BaseModel, Field, field_validator
+
+from .dates import DateBlock, date_block, get_zone
 
 
 class SiteConfig(BaseModel):
@@ -11,12 +16,46 @@ class SiteConfig(BaseModel):
     description: str
     homepage_url: str | None = None
     x_username: str | None = None
+    timezone: str | None = None
+
+    @field_validator("timezone")
+    @classmethod
+    def _check_timezone(cls, value: str | None) -> str | None:
+        if value is not None:
+            try:
+                get_zone(value)
+            except (ZoneInfoNotFoundError, ValueError) as e:
+                raise ValueError(f"Unknown timezone: {value}") from e
+        return value
+
+
+class RuleSet(BaseModel):
+    categories: list[str] = Field(default_factory=list)
+    keywords: list[str] = Field(default_factory=list)
+    patterns: list[str] = Field(default_factory=list)
+
+    @field_validator("patterns")
+    @classmethod
+    def _check_patterns(cls, value: list[str]) -> list[str]:
+        for pattern in value:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid pattern {pattern!r}: {e}") from e
+        return value
+
+    def is_empty(self) -> bool:
+        return not (self.categories or self.keywords or self.patterns)
 
 
 class FiltersConfig(BaseModel):
     start_date: date = Field(default_factory=date.today)
     end_date: date | None = None
     max_events: int | None = None
+    include: RuleSet = Field(default_factory=RuleSet)
+    exclude: RuleSet = Field(default_factory=RuleSet)
+    min_duration: timedelta | None = None
+    max_duration: timedelta | None = None
 
     def effective_end_date(self) -> date:
         if self.end_date is not None:
@@ -42,6 +81,19 @@ class StructuredDataConfig(BaseModel):
 
 class OutputConfig(BaseModel):
     file: str = "./events/index.html"
+    service_worker: bool = False
+
+
+class LinkCheckConfig(BaseModel):
+    enabled: bool = False
+    drop_broken: bool = False
+    cache_file: str = ".link-cache.json"
+    ttl_hours: float = 24
+    broken_ttl_hours: float = 6
+    concurrency: int = Field(default=8, ge=1)
+    per_host: int = Field(default=2, ge=1)
+    min_interval: float = 0.25
+    timeout: float = 10
 
 
 class Config(BaseModel):
@@ -53,6 +105,7 @@ class Config(BaseModel):
     meta: MetaConfig = Field(default_factory=MetaConfig)
     structured_data: StructuredDataConfig = Field(default_factory=StructuredDataConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
+    links: LinkCheckConfig = Field(default_factory=LinkCheckConfig)
     wrangler_pages_project: str | None = Field(
         default=None, alias="wrangler-pages-project"
     )
@@ -74,3 +127,25 @@ class TemplateEvent(BaseModel):
     anchor_id: str = ""
     date_display: str = ""
     duration_days: int = 1
+
+    @property
+    def date_block(self) -> DateBlock:
+        return date_block(self.start_date)
+
+    @property
+    def ends_at(self) -> datetime:
+        """When the event is over.
+
+        All-day events end at midnight after their last day and are naive
+        (floating), so viewers see them end at their own local midnight.
+        Timed events without an end run until the end of their start day.
+        """
+        if not self.is_all_day and self.start_datetime is not None:
+            if self.end_datetime is not None:
+                return self.end_datetime
+            start = self.start_datetime
+            return datetime.combine(
+                start.date() + timedelta(days=1), time(), tzinfo=start.tzinfo
+            )
+        last_day = self.end_date or self.start_date
+        return datetime.combine(last_day + timedelta(days=1), time())
@@ -0,0 +1,114 @@
+"""Include/exclude rules compiled into a single event matcher."""
+
+from __future__ import annotations
+
+import re
+from datetime import datetime, timedelta
+
+from ical.event import Event
+
+from .models import FiltersConfig, RuleSet
+
+
+def _mergeable(pattern: str) -> bool:
+    """Whether a pattern means the same inside a shared alternation.
+
+    Groups would be renumbered (or clash by name) and leading global flags
+    such as ``(?i)`` are an error once wrapped, so those stay separate.
+    """
+    try:
+        return re.compile(f"(?:{pattern})").groups == 0
+    except re.error:
+        return False
+
+
+class _CompiledRuleSet:
+    """One side (include or exclude) of the rules, ready for matching."""
+
+    def __init__(self, rules: RuleSet) -> None:
+        self.categories = frozenset(c.casefold() for c in rules.categories)
+        # Keywords are literal and case-insensitive; patterns keep their own
+        # flags. Where safe, both are merged into one alternation so text is
+        # scanned once, and MULTILINE lets ^/$ anchor to each field rather
+        # than the whole.
+        alternatives = [f"(?i:{re.escape(k)})" for k in rules.keywords]
+        alternatives += [f"(?:{p})" for p in rules.patterns if _mergeable(p)]
+        self.text = (
+            re.compile("|".join(alternatives), re.MULTILINE) if alternatives else None
+        )
+        self.separate = tuple(
+            re.compile(p, re.MULTILINE) for p in rules.patterns if not _mergeable(p)
+        )
+
+    def matches(self, text: str, categories: frozenset[str]) -> bool:
+        if self.categories and not self.categories.isdisjoint(categories):
+            return True
+        if self.text is not None and self.text.search(text) is not None:
+            return True
+        return any(p.search(text) is not None for p in self.separate)
+
+
+def _raw_duration(event: Event) -> timedelta:
+    """Duration from DTEND or DURATION; all-day events without either last a day."""
+    try:
+        return event.computed_duration
+    except TypeError:
+        # DTSTART and DTEND disagree on being a date or a date-time
+        if isinstance(event.dtstart, datetime):
+            return timedelta(0)
+        return timedelta(days=1)
+
+
+class EventMatcher:
+    """Decide whether a raw calendar event passes the configured rules.
+
+    An event is rejected if it matches any exclude rule, or if include
+    rules are configured and it matches none of them, or if its duration
+    falls outside ``min_duration``/``max_duration``.
+    """
+
+    def __init__(self, filters: FiltersConfig) -> None:
+        self._include = (
+            None if filters.include.is_empty() else _CompiledRuleSet(filters.include)
+        )
+        self._exclude = (
+            None if filters.exclude.is_empty() else _CompiledRuleSet(filters.exclude)
+        )
+        self._min_duration = filters.min_duration
+        self._max_duration = filters.max_duration
+
+    def accepts(self, event: Event) -> bool:
+        if self._min_duration is not None or self._max_duration is not None:
+            duration = _raw_duration(event)
+            if self._min_duration is not None and duration < self._min_duration:
+                return False
+            if self._max_duration is not None and duration > self._max_duration:
+                return False
+
+        if self._include is None and self._exclude is None:
+            return True
+
+        text = "\n".join(
+            str(value)
+            for value in (event.summary, event.description, event.location)
+            if value
+        )
+        categories = frozenset(str(c).casefold() for c in event.categories or ())
+
+        if self._exclude is not None and self._exclude.matches(text, categories):
+            return False
+        if self._include is not None and not self._include.matches(text, categories):
+            return False
+        return True
+
+
+def compile_rules(filters: FiltersConfig) -> EventMatcher | None:
+    """Compile the filters' rules, or return None if none are configured."""
+    if (
+        filters.include.is_empty()
+        and filters.exclude.is_empty()
+        and filters.min_duration is None
+        and filters.max_duration is None
+    ):
+        return None
+    return EventMatcher(filters)
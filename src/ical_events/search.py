@@ -0,0 +1,105 @@
+"""Build-time search and category facet indexes over events."""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from bisect import bisect_left
+
+from .models import TemplateEvent
+
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase, accent-stripped alphanumeric tokens.
+
+    Mirrors ``tokenize`` in ``scripts/search.js`` so build-time and
+    query-time tokens agree.
+    """
+    text = text.lower()
+    if text.isascii():
+        return _TOKEN_RE.findall(text)
+    normalized = unicodedata.normalize("NFKD", text)
+    stripped = "".join(
+        c for c in normalized if not unicodedata.category(c).startswith("M")
+    )
+    return _TOKEN_RE.findall(stripped)
+
+
+def _event_text(event: TemplateEvent) -> str:
+    parts = [event.summary, event.description or "", event.location or ""]
+    parts.extend(event.categories)
+    return " ".join(parts)
+
+
+def _utf16_key(token: str) -> bytes:
+    # JavaScript compares strings by UTF-16 code unit, so sort the same way
+    # to keep the client's binary search valid for astral-plane characters.
+    return token.encode("utf-16-be")
+
+
+def _delta_encode(ids: list[int]) -> list[int]:
+    """Encode a sorted list as its first value followed by successive gaps."""
+    return ids[:1] + [b - a for a, b in zip(ids, ids[1:])]
+
+
+def build_search_index(events: list[TemplateEvent]) -> dict:
+    """Build an inverted index of tokens → event positions.
+
+    Tokens are sorted so the client can binary-search a prefix range.
+    Each postings list is sorted ascending and delta-encoded (first value
+    absolute, then gaps) to keep the serialized index small.
+    """
+    postings: dict[str, list[int]] = {}
+    for idx, event in enumerate(events):
+        for token in set(tokenize(_event_text(event))):
+            postings.setdefault(token, []).append(idx)
+
+    tokens = sorted(postings, key=_utf16_key)
+    return {
+        "tokens": tokens,
+        "postings": [_delta_encode(postings[t]) for t in tokens],
+    }
+
+
+def build_category_facets(events: list[TemplateEvent]) -> list[dict]:
+    """Group event positions by category for client-side facet filtering.
+
+    Returns one entry per category with its event count and delta-encoded
+    sorted positions, ordered by descending count then name.
+    """
+    members: dict[str, list[int]] = {}
+    for idx, event in enumerate(events):
+        for category in dict.fromkeys(event.categories):
+            members.setdefault(category, []).append(idx)
+
+    ordered = sorted(members.items(), key=lambda item: (-len(item[1]), item[0]))
+    return [
+        {"name": name, "count": len(ids), "ids": _delta_encode(ids)}
+        for name, ids in ordered
+    ]
+
+
+def search_index(index: dict, query: str) -> list[int]:
+    """Return sorted event positions matching every query term as a prefix.
+
+    Reference implementation of the lookup performed in ``scripts/search.js``.
+    """
+    tokens: list[str] = index["tokens"]
+    result: set[int] | None = None
+
+    for term in tokenize(query):
+        matched: set[int] = set()
+        i = bisect_left(tokens, _utf16_key(term), key=_utf16_key)
+        while i < len(tokens) and tokens[i].startswith(term):
+            pos = 0
+            for gap in index["postings"][i]:
+                pos += gap
+                matched.add(pos)
+            i += 1
+        result = matched if result is None else result & matched
+        if not result:
+            return []
+
+    return sorted(result) if result is not None else []
@@ -0,0 +1,215 @@
+"""Embedded HTTP server that serves the rendered site from memory."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import sys
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from .calendar import fetch_calendar_data, parse_events
+from .generator import SERVICE_WORKER_FILE, generate_html, generate_service_worker
+from .links import check_event_links
+from .models import Config
+
+
+@dataclass(frozen=True, slots=True)
+class Resource:
+    """A response body held in memory alongside its gzip encoding."""
+
+    content_type: str
+    body: bytes
+    gzip_body: bytes
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, content_type: str, body: bytes) -> Resource:
+        return cls(
+            content_type=content_type,
+            body=body,
+            gzip_body=gzip.compress(body, mtime=0),
+            etag=hashlib.sha256(body).hexdigest()[:32],
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Snapshot:
+    """An immutable, fully rendered version of the site."""
+
+    resources: dict[str, Resource]
+    event_count: int
+    built_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+def build_snapshot(config: Config, workers: int = 1) -> Snapshot:
+    """Fetch, parse and render the calendar into an in-memory snapshot."""
+    ics_content = fetch_calendar_data(config.calendar)
+    events = parse_events(ics_content, config.filters, workers, config.site.timezone)
+    if config.links.enabled:
+        check_event_links(events, config.links)
+    html = generate_html(config, events)
+
+    page = Resource.from_bytes("text/html; charset=utf-8", html.encode("utf-8"))
+    page_name = Path(config.output.file).name
+    resources = {"/": page, f"/{page_name}": page}
+
+    if config.output.service_worker:
+        sw = generate_service_worker({page_name: html})
+        resources[f"/{SERVICE_WORKER_FILE}"] = Resource.from_bytes(
+            "text/javascript; charset=utf-8", sw.encode("utf-8")
+        )
+
+    return Snapshot(resources=resources, event_count=len(events))
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Return True if an Accept-Encoding header allows gzip."""
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        if coding.strip().lower() not in ("gzip", "*"):
+            continue
+        q = params.strip()
+        if q.startswith("q="):
+            try:
+                return float(q[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
+class _SiteRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _SiteHTTPServer
+
+    def do_GET(self) -> None:
+        self._respond(include_body=True)
+
+    def do_HEAD(self) -> None:
+        self._respond(include_body=False)
+
+    def _respond(self, include_body: bool) -> None:
+        # Read the snapshot once so a concurrent swap can't mix versions
+        snapshot = self.server.site.snapshot
+        resource = snapshot.resources.get(self.path.split("?", 1)[0])
+        if resource is None:
+            self.send_error(HTTPStatus.NOT_FOUND)
+            return
+
+        use_gzip = _accepts_gzip(self.headers.get("Accept-Encoding", ""))
+        if use_gzip:
+            body, etag = resource.gzip_body, f'"{resource.etag}-gzip"'
+        else:
+            body, etag = resource.body, f'"{resource.etag}"'
+
+        if _etag_matches(self.headers.get("If-None-Match"), etag):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_validators(etag, snapshot)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", resource.content_type)
+        self.send_header("Content-Length", str(len(body)))
+        if use_gzip:
+            self.send_header("Content-Encoding", "gzip")
+        self._send_validators(etag, snapshot)
+        self.end_headers()
+        if include_body:
+            self.wfile.write(body)
+
+    def _send_validators(self, etag: str, snapshot: Snapshot) -> None:
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", format_datetime(snapshot.built_at, True))
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Vary", "Accept-Encoding")
+
+
+class _SiteHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], site: SiteServer) -> None:
+        self.site = site
+        super().__init__(address, _SiteRequestHandler)
+
+
+class SiteServer:
+    """Serve the current snapshot while rebuilding it on a schedule.
+
+    Rebuilds run on a background thread and replace ``snapshot`` with a
+    single reference assignment, so requests never wait on a fetch or
+    render and always see one complete version of the site.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        refresh_interval: float = 3600,
+        workers: int = 1,
+    ) -> None:
+        self.config = config
+        self.refresh_interval = refresh_interval
+        self.workers = workers
+        self.snapshot = build_snapshot(config, workers)
+        self._stop = threading.Event()
+        self.httpd = _SiteHTTPServer((host, port), self)
+
+    @property
+    def address(self) -> tuple[str, int]:
+        host, port = self.httpd.server_address[:2]
+        return str(host), int(port)
+
+    def refresh(self) -> bool:
+        """Rebuild the snapshot, keeping the current one if the build fails."""
+        try:
+            snapshot = build_snapshot(self.config, self.workers)
+        except SystemExit:
+            # The failing stage has already reported the error on stderr
+            print("Warning: Refresh failed; serving previous version.", file=sys.stderr)
+            return False
+        except Exception as e:
+            # Anything else must not kill the refresh thread either
+            print(
+                f"Warning: Refresh failed ({e.__class__.__name__}: {e}); "
+                "serving previous version.",
+                file=sys.stderr,
+            )
+            return False
+        self.snapshot = snapshot
+        print(f"Refreshed {snapshot.event_count} events")
+        return True
+
+    def _refresh_loop(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            self.refresh()
+
+    def serve_forever(self) -> None:
+        refresher = threading.Thread(target=self._refresh_loop, daemon=True)
+        refresher.start()
+        try:
+            self.httpd.serve_forever()
+        finally:
+            self._stop.set()
+            self.httpd.server_close()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        self.httpd.shutdown()
@@ -0,0 +1,113 @@
+(function() {
+  'use strict';
+
+  var bitsets = null;
+  var selected = {};
+  var mask = null;
+
+  function wordCount() {
+    return (document.querySelectorAll('.event-card').length + 31) >>> 5;
+  }
+
+  function loadBitsets() {
+    if (bitsets === null) {
+      var el = document.getElementById('facet-index');
+      var lists = [];
+      try {
+        lists = el ? JSON.parse(el.textContent) : [];
+      } catch (e) {
+        lists = [];
+      }
+
+      var words = wordCount();
+      bitsets = lists.map(function(gaps) {
+        var bits = new Uint32Array(words);
+        var pos = 0;
+        for (var i = 0; i < gaps.length; i++) {
+          pos += gaps[i];
+          bits[pos >>> 5] |= 1 << (pos & 31);
+        }
+        return bits;
+      });
+    }
+    return bitsets;
+  }
+
+  function popcount(x) {
+    x -= (x >>> 1) & 0x55555555;
+    x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+    return Math.imul((x + (x >>> 4)) & 0x0F0F0F0F, 0x01010101) >>> 24;
+  }
+
+  // Each facet counts the events it would show given the other filters,
+  // i.e. popcount(facet bitset AND base mask), one word at a time
+  function updateCounts(baseMask) {
+    var sets = loadBitsets();
+    document.querySelectorAll('.facet-btn').forEach(function(btn) {
+      var bits = sets[btn.getAttribute('data-facet')];
+      var countEl = btn.querySelector('.facet-count');
+      if (!bits || !countEl) {
+        return;
+      }
+      var count = 0;
+      for (var w = 0; w < bits.length; w++) {
+        count += popcount(bits[w] & baseMask[w]);
+      }
+      countEl.textContent = count;
+    });
+  }
+
+  // An event matches when it carries any of the selected categories
+  function rebuildMask() {
+    var sets = loadBitsets();
+    var result = null;
+
+    Object.keys(selected).forEach(function(key) {
+      var bits = sets[key];
+      if (!bits) {
+        return;
+      }
+      if (result === null) {
+        result = new Uint32Array(bits.length);
+      }
+      for (var w = 0; w < bits.length; w++) {
+        result[w] |= bits[w];
+      }
+    });
+
+    mask = result;
+  }
+
+  function init() {
+    document.addEventListener('click', function(e) {
+      var btn = e.target.closest('.facet-btn');
+      if (btn) {
+        var key = btn.getAttribute('data-facet');
+        var pressed = !selected[key];
+        if (pressed) {
+          selected[key] = true;
+        } else {
+          delete selected[key];
+        }
+        btn.setAttribute('aria-pressed', pressed ? 'true' : 'false');
+        rebuildMask();
+        if (typeof window.__updateFilter === 'function') {
+          window.__updateFilter();
+        }
+      }
+    });
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+
+  window.__updateFacetCounts = updateCounts;
+
+  // Returns a Uint32Array bitset over card positions, or null when no facet is selected
+  window.__getFacetMatches = function() {
+    return mask;
+  };
+})();
@@ -1,23 +1,74 @@
 (function() {
   'use strict';
 
+  // setTimeout delays overflow past ~24.8 days
+  var MAX_TIMEOUT = 2147483647;
+
   var favoritesOnly = false;
+  var cardEnds = null;
+  var expiryTimer = null;
+
+  function parseEnd(el) {
+    var value = el.getAttribute('data-end');
+    var time = value ? Date.parse(value) : NaN;
+    return isNaN(time) ? Infinity : time;
+  }
+
+  // Re-run the filter when the next still-visible event ends
+  function scheduleExpiry(nextEnd) {
+    clearTimeout(expiryTimer);
+    if (nextEnd !== Infinity) {
+      expiryTimer = setTimeout(updateFilter, Math.min(nextEnd - Date.now() + 1000, MAX_TIMEOUT));
+    }
+  }
 
   function updateFilter() {
     var cards = document.querySelectorAll('.event-card');
     var separators = document.querySelectorAll('.month-separator');
     var countEl = document.querySelector('.event-count');
     var emptyState = document.querySelector('.empty-state');
+    var searchMatches = typeof window.__getSearchMatches === 'function' ? window.__getSearchMatches() : null;
+    var facetMatches = typeof window.__getFacetMatches === 'function' ? window.__getFacetMatches() : null;
+    var searching = searchMatches !== null;
+    var faceted = facetMatches !== null;
+    var narrowed = searching || faceted;
+    var filtering = favoritesOnly || narrowed;
+    var now = Date.now();
+    var nextEnd = Infinity;
+    var total = 0;
     var visibleCount = 0;
 
+    if (cardEnds === null) {
+      cardEnds = Array.prototype.map.call(cards, parseEnd);
+    }
+
+    // Cards passing every filter except the category facets
+    var baseMask = new Uint32Array((cards.length + 31) >>> 5);
+
     // Track which months have visible events
     var visibleMonths = {};
 
-    cards.forEach(function(card) {
+    cards.forEach(function(card, i) {
       var uid = card.getAttribute('data-uid');
       var month = card.getAttribute('data-month');
+      var ended = cardEnds[i] <= now;
+
+      if (!ended) {
+        total++;
+        if (cardEnds[i] < nextEnd) {
+          nextEnd = cardEnds[i];
+        }
+      }
+
+      var passesOthers = !ended &&
+          !(favoritesOnly && !window.__isFavorited(uid)) &&
+          !(searching && !searchMatches[i]);
+      if (passesOthers) {
+        baseMask[i >>> 5] |= 1 << (i & 31);
+      }
 
-      if (favoritesOnly && !window.__isFavorited(uid)) {
+      if (!passesOthers ||
+          (faceted && !((facetMatches[i >>> 5] >>> (i & 31)) & 1))) {
         card.classList.add('hidden');
       } else {
         card.classList.remove('hidden');
@@ -28,10 +79,14 @@
       }
     });
 
+    if (typeof window.__updateFacetCounts === 'function') {
+      window.__updateFacetCounts(baseMask);
+    }
+
     // Show/hide month separators
     separators.forEach(function(sep) {
       var month = sep.getAttribute('data-month');
-      if (favoritesOnly && !visibleMonths[month]) {
+      if (parseEnd(sep) <= now || !visibleMonths[month]) {
         sep.classList.add('hidden');
       } else {
         sep.classList.remove('hidden');
@@ -40,8 +95,9 @@
 
     // Update count
     if (countEl) {
-      var total = cards.length;
-      if (favoritesOnly) {
+      if (narrowed) {
+        countEl.textContent = visibleCount + ' match' + (visibleCount !== 1 ? 'es' : '') + ' of ' + total + ' events';
+      } else if (favoritesOnly) {
         countEl.textContent = visibleCount + ' favorite' + (visibleCount !== 1 ? 's' : '') + ' of ' + total + ' events';
       } else {
         countEl.textContent = total + ' event' + (total !== 1 ? 's' : '');
@@ -50,13 +106,21 @@
 
     // Empty state
     if (emptyState) {
-      if (favoritesOnly && visibleCount === 0) {
+      if (visibleCount === 0 && (filtering || cards.length > 0)) {
         emptyState.classList.remove('hidden');
-        emptyState.textContent = 'No favorites yet. Click the \u2661 on events to add them.';
+        if (total === 0) {
+          emptyState.textContent = 'No upcoming events.';
+        } else if (narrowed) {
+          emptyState.textContent = 'No events match the current filters.';
+        } else {
+          emptyState.textContent = 'No favorites yet. Click the \u2661 on events to add them.';
+        }
       } else {
         emptyState.classList.add('hidden');
       }
     }
+
+    scheduleExpiry(nextEnd);
   }
 
   function init() {
@@ -69,6 +133,13 @@
       });
     }
 
+    // Timers are throttled in background tabs, so re-check on return
+    document.addEventListener('visibilitychange', function() {
+      if (!document.hidden) {
+        updateFilter();
+      }
+    });
+
     // Initial filter
     updateFilter();
   }
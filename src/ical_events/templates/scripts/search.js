@@ -0,0 +1,123 @@
+(function() {
+  'use strict';
+
+  var index = null;
+  var decoded = [];
+  var matches = null;
+
+  function loadIndex() {
+    if (index === null) {
+      var el = document.getElementById('search-index');
+      try {
+        index = el ? JSON.parse(el.textContent) : null;
+      } catch (e) {
+        index = null;
+      }
+      if (!index) {
+        index = { tokens: [], postings: [] };
+      }
+    }
+    return index;
+  }
+
+  // Must match ical_events.search.tokenize
+  function tokenize(text) {
+    var normalized = text.toLowerCase().normalize('NFKD').replace(/\p{M}/gu, '');
+    return normalized.match(/[\p{L}\p{N}]+/gu) || [];
+  }
+
+  function postingsAt(i) {
+    if (!decoded[i]) {
+      var gaps = index.postings[i];
+      var ids = new Array(gaps.length);
+      var pos = 0;
+      for (var j = 0; j < gaps.length; j++) {
+        pos += gaps[j];
+        ids[j] = pos;
+      }
+      decoded[i] = ids;
+    }
+    return decoded[i];
+  }
+
+  function lowerBound(tokens, term) {
+    var lo = 0;
+    var hi = tokens.length;
+    while (lo < hi) {
+      var mid = (lo + hi) >>> 1;
+      if (tokens[mid] < term) {
+        lo = mid + 1;
+      } else {
+        hi = mid;
+      }
+    }
+    return lo;
+  }
+
+  function search(query, total) {
+    var terms = tokenize(query);
+    if (terms.length === 0) {
+      return null;
+    }
+
+    var idx = loadIndex();
+    var result = null;
+
+    for (var t = 0; t < terms.length; t++) {
+      var term = terms[t];
+      var matched = new Uint8Array(total);
+      for (var i = lowerBound(idx.tokens, term);
+           i < idx.tokens.length && idx.tokens[i].lastIndexOf(term, 0) === 0;
+           i++) {
+        var ids = postingsAt(i);
+        for (var k = 0; k < ids.length; k++) {
+          matched[ids[k]] = 1;
+        }
+      }
+      if (result === null) {
+        result = matched;
+      } else {
+        for (var n = 0; n < total; n++) {
+          result[n] &= matched[n];
+        }
+      }
+    }
+
+    return result;
+  }
+
+  function init() {
+    var input = document.querySelector('.search-input');
+    if (!input) {
+      return;
+    }
+
+    function runSearch() {
+      var total = document.querySelectorAll('.event-card').length;
+      matches = search(input.value, total);
+    }
+
+    input.addEventListener('input', function() {
+      runSearch();
+      if (typeof window.__updateFilter === 'function') {
+        window.__updateFilter();
+      }
+    });
+
+    // Browsers may restore the field value on back/forward navigation
+    if (input.value) {
+      runSearch();
+    }
+  }
+
+  if (document.readyState === 'loading') {
+    document.addEventListener('DOMContentLoaded', init);
+  } else {
+    init();
+  }
+
+  // Returns a per-card match array (1 = match) or null when no search is active
+  window.__getSearchMatches = function() {
+    return matches;
+  };
+})();
@@ -0,0 +1,13 @@
+(function() {
+  'use strict';
+
+  if (!('serviceWorker' in navigator)) {
+    return;
+  }
+
+  window.addEventListener('load', function() {
+    navigator.serviceWorker.register('sw.js').catch(function() {
+      // offline support unavailable (e.g. file:// or private mode)
+    });
+  });
+})();
@@ -1,10 +1,11 @@
 """Tests for calendar parsing."""
 
-from datetime import date
+from datetime import date, datetime, timezone
 
 import pytest
 
-from ical_events.calendar import parse_events, fetch_calendar_data
+from ical_events import calendar
+from ical_events.calendar import _split_vevents, parse_events, fetch_calendar_data
 from ical_events.models import FiltersConfig
 
 
@@ -98,3 +99,181 @@ def test_fetch_calendar_data_missing_file():
     with pytest.raises(SystemExit) as exc_info:
         fetch_calendar_data("/nonexistent/calendar.ics")
     assert exc_info.value.code == 2
+
+
+TIMEZONE_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//EN
+BEGIN:VTIMEZONE
+TZID:America/Los_Angeles
+BEGIN:STANDARD
+TZOFFSETFROM:-0700
+TZOFFSETTO:-0800
+DTSTART:20071104T020000
+RRULE:FREQ=YEARLY;BYMONTH=11;BYDAY=1SU
+END:STANDARD
+END:VTIMEZONE
+BEGIN:VEVENT
+UID:tz-1@test
+DTSTAMP:20260101T000000Z
+DTSTART;TZID=America/Los_Angeles:20260305T180000
+SUMMARY:Evening Meetup
+BEGIN:VALARM
+ACTION:DISPLAY
+TRIGGER:-PT15M
+DESCRIPTION:Reminder
+END:VALARM
+END:VEVENT
+BEGIN:VEVENT
+UID:tz-2@test
+DTSTAMP:20260101T000000Z
+DTSTART;VALUE=DATE:20260301
+SUMMARY:All Day
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_split_vevents_keeps_shared_components():
+    shared, vevents = _split_vevents(TIMEZONE_ICS)
+    assert len(vevents) == 2
+    assert "TZID:America/Los_Angeles" in shared
+    assert "BEGIN:VCALENDAR" not in shared
+    assert "END:VCALENDAR" not in shared
+    assert "BEGIN:VALARM" in vevents[0]
+
+
+def test_split_vevents_rejects_non_calendar():
+    assert _split_vevents("not a calendar") is None
+    assert _split_vevents(TIMEZONE_ICS + TIMEZONE_ICS) is None
+
+
+def test_parse_events_parallel_matches_serial(
+    sample_ics_content, wide_filters, monkeypatch
+):
+    serial = parse_events(sample_ics_content, wide_filters)
+    monkeypatch.setattr(calendar, "PARALLEL_MIN_EVENTS", 0)
+    parallel = parse_events(sample_ics_content, wide_filters, workers=2)
+    assert parallel == serial
+
+
+def test_parse_events_parallel_timezones(wide_filters, monkeypatch):
+    monkeypatch.setattr(calendar, "PARALLEL_MIN_EVENTS", 0)
+    events = parse_events(TIMEZONE_ICS, wide_filters, workers=2)
+    assert [e.uid for e in events] == ["tz-2@test", "tz-1@test"]
+    assert events[1].start_datetime.utcoffset().total_seconds() == -8 * 3600
+
+
+def test_parse_events_parallel_small_input_falls_back(
+    sample_ics_content, wide_filters, monkeypatch
+):
+    def fail(*args, **kwargs):
+        raise AssertionError("pool should not be used")
+
+    monkeypatch.setattr(calendar, "ProcessPoolExecutor", fail)
+    events = parse_events(sample_ics_content, wide_filters, workers=4)
+    assert len(events) == 5
+
+
+def test_event_ends_at_all_day(sample_ics_content, wide_filters):
+    events = parse_events(sample_ics_content, wide_filters)
+    multi = next(e for e in events if e.uid == "test-multiday-2@test")
+    assert multi.ends_at == datetime(2026, 3, 13)
+    assert multi.ends_at.tzinfo is None
+
+
+def test_event_ends_at_timed_without_end(wide_filters):
+    events = parse_events(TIMEZONE_ICS, wide_filters)
+    timed = next(e for e in events if e.uid == "tz-1@test")
+    assert timed.ends_at.date() == date(2026, 3, 6)
+    assert timed.ends_at.utcoffset() == timed.start_datetime.utcoffset()
+
+
+DURATION_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//EN
+BEGIN:VEVENT
+UID:duration-1@test
+DTSTAMP:20260101T000000Z
+DTSTART:20260301T180000Z
+DURATION:P3D
+SUMMARY:Three Day Hackathon
+END:VEVENT
+BEGIN:VEVENT
+UID:duration-2@test
+DTSTAMP:20260101T000000Z
+DTSTART;VALUE=DATE:20260310
+DURATION:P2D
+SUMMARY:Two Day Retreat
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_event_ends_at_from_duration(wide_filters):
+    events = {e.uid: e for e in parse_events(DURATION_ICS, wide_filters)}
+    timed = events["duration-1@test"]
+    assert timed.ends_at == datetime(2026, 3, 4, 18, tzinfo=timezone.utc)
+    assert timed.end_date == date(2026, 3, 4)
+    all_day = events["duration-2@test"]
+    assert all_day.end_date == date(2026, 3, 11)
+    assert all_day.ends_at == datetime(2026, 3, 12)
+
+
+UTC_ICS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//Test//EN
+BEGIN:VEVENT
+UID:utc-1@test
+DTSTAMP:20260101T000000Z
+DTSTART:20260401T030000Z
+DTEND:20260401T050000Z
+SUMMARY:Late Night Stream
+END:VEVENT
+END:VCALENDAR
+"""
+
+
+def test_parse_events_site_timezone(wide_filters):
+    events = parse_events(UTC_ICS, wide_filters, timezone="America/Los_Angeles")
+    event = events[0]
+    # 03:00 UTC on Apr 1 is 20:00 PDT on Mar 31
+    assert event.start_datetime.hour == 20
+    assert event.start_date == date(2026, 3, 31)
+    assert event.month_key == "2026-03"
+    assert event.date_display == "Mar 31, 2026"
+
+
+def test_parse_events_without_timezone_keeps_feed_zone(wide_filters):
+    events = parse_events(UTC_ICS, wide_filters)
+    assert events[0].start_date == date(2026, 4, 1)
+    assert events[0].start_datetime.utcoffset().total_seconds() == 0
+
+
+UNICODE_BREAK_ICS = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Test//EN\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:nel-1@test\r\n"
+    "DTSTAMP:20260101T000000Z\r\n"
+    "DTSTART;VALUE=DATE:20260301\r\n"
+    "SUMMARY:Line Separator\r\n"
+    "DESCRIPTION:line\x85two\u2028three four\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+def test_split_vevents_only_on_line_endings():
+    shared, vevents = _split_vevents(UNICODE_BREAK_ICS)
+    assert len(vevents) == 1
+    assert "DESCRIPTION:line\x85two\u2028three four" in vevents[0].split("\r\n")
+
+
+def test_parse_events_parallel_unicode_line_breaks(wide_filters, monkeypatch):
+    serial = parse_events(UNICODE_BREAK_ICS, wide_filters)
+    monkeypatch.setattr(calendar, "PARALLEL_MIN_EVENTS", 0)
+    parallel = parse_events(UNICODE_BREAK_ICS, wide_filters, workers=2)
+    assert parallel == serial
+    assert parallel[0].description == "line\x85two\u2028three four"
@@ -63,3 +63,67 @@ def test_config_not_a_mapping(tmp_path):
     with pytest.raises(SystemExit) as exc_info:
         load_config(str(cfg))
     assert exc_info.value.code == 1
+
+
+def test_config_timezone(tmp_path):
+    cfg = tmp_path / "tz.yaml"
+    cfg.write_text(textwrap.dedent("""\
+        calendar: test.ics
+        site:
+          title: Zoned
+          description: Zoned test
+          timezone: America/Los_Angeles
+    """))
+    config = load_config(str(cfg))
+    assert config.site.timezone == "America/Los_Angeles"
+
+
+def test_config_unknown_timezone(tmp_path):
+    cfg = tmp_path / "badtz.yaml"
+    cfg.write_text(textwrap.dedent("""\
+        calendar: test.ics
+        site:
+          title: Zoned
+          description: Zoned test
+          timezone: Mars/Olympus_Mons
+    """))
+    with pytest.raises(SystemExit) as exc_info:
+        load_config(str(cfg))
+    assert exc_info.value.code == 1
+
+
+def test_config_filter_rules(tmp_path):
+    cfg = tmp_path / "rules.yaml"
+    cfg.write_text(textwrap.dedent("""\
+        calendar: test.ics
+        site:
+          title: Rules
+          description: Rules test
+        filters:
+          include:
+            categories: [Tech]
+          exclude:
+            keywords: [webinar]
+            patterns: ["^Cancelled"]
+          max_duration: P3D
+    """))
+    config = load_config(str(cfg))
+    assert config.filters.include.categories == ["Tech"]
+    assert config.filters.exclude.patterns == ["^Cancelled"]
+    assert config.filters.max_duration.days == 3
+
+
+def test_config_invalid_filter_pattern(tmp_path):
+    cfg = tmp_path / "badrule.yaml"
+    cfg.write_text(textwrap.dedent("""\
+        calendar: test.ics
+        site:
+          title: Rules
+          description: Rules test
+        filters:
+          exclude:
+            patterns: ["(unclosed"]
+    """))
+    with pytest.raises(SystemExit) as exc_info:
+        load_config(str(cfg))
+    assert exc_info.value.code == 1
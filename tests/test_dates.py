@@ -0,0 +1,63 @@
+"""Tests for timezone conversion and memoized date formatting."""
+
+from datetime import date, datetime, timezone
+
+from ical_events.dates import (
+    date_block,
+    format_date_display,
+    get_zone,
+    month_key,
+    to_zone,
+)
+
+
+def test_to_zone_across_dst():
+    la = get_zone("America/Los_Angeles")
+    # US DST starts 2026-03-08 at 2:00 local
+    before = to_zone(datetime(2026, 3, 8, 9, 0, tzinfo=timezone.utc), la)
+    after = to_zone(datetime(2026, 3, 8, 11, 0, tzinfo=timezone.utc), la)
+    assert before.hour == 1 and before.utcoffset().total_seconds() == -8 * 3600
+    assert after.hour == 4 and after.utcoffset().total_seconds() == -7 * 3600
+
+
+def test_to_zone_keeps_floating_time():
+    naive = datetime(2026, 3, 8, 9, 0)
+    assert to_zone(naive, get_zone("Europe/Berlin")) is naive
+
+
+def test_to_zone_without_zone():
+    moment = datetime(2026, 3, 8, 9, 0, tzinfo=timezone.utc)
+    assert to_zone(moment, None) is moment
+
+
+def test_get_zone_cached():
+    assert get_zone("Europe/Berlin") is get_zone("Europe/Berlin")
+
+
+def test_format_date_display():
+    assert format_date_display(date(2026, 3, 1), None) == "Mar 01, 2026"
+    assert format_date_display(date(2026, 3, 10), date(2026, 3, 12)) == (
+        "Mar 10–12, 2026"
+    )
+    assert format_date_display(date(2026, 3, 30), date(2026, 4, 2)) == (
+        "Mar 30–Apr 02, 2026"
+    )
+    assert format_date_display(date(2026, 12, 30), date(2027, 1, 2)) == (
+        "Dec 30, 2026–Jan 02, 2027"
+    )
+
+
+def test_format_date_display_memoized():
+    format_date_display.cache_clear()
+    format_date_display(date(2026, 5, 1), date(2026, 5, 3))
+    format_date_display(date(2026, 5, 1), date(2026, 5, 3))
+    assert format_date_display.cache_info().hits == 1
+
+
+def test_month_key():
+    assert month_key(date(2026, 3, 9)) == "2026-03"
+
+
+def test_date_block():
+    block = date_block(date(2026, 3, 9))
+    assert (block.month, block.day, block.year) == ("Mar", "9", "2026")
@@ -1,12 +1,16 @@
 """Tests for HTML generation."""
 
-from datetime import date
+from datetime import date, datetime, time, timedelta, timezone
 
 import pytest
 
 from ical_events.calendar import parse_events
 from ical_events.config import load_config
-from ical_events.generator import generate_html
+from ical_events.generator import (
+    compute_valid_until,
+    generate_html,
+    generate_service_worker,
+)
 from ical_events.models import Config, FiltersConfig, SiteConfig, TemplateEvent
 
 
@@ -183,3 +187,121 @@ def test_full_pipeline(sample_config_path):
     html = generate_html(config, events)
     assert "<!DOCTYPE html>" in html
     assert len(events) > 0
+
+
+def test_generate_html_search(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    assert 'class="search-input"' in html
+    assert '<script type="application/json" id="search-index">' in html
+    assert '"tokens":' in html
+    assert "__getSearchMatches" in html
+
+
+def test_generate_html_category_facets(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    assert 'class="facet-btn"' in html
+    assert 'data-facet="0"' in html
+    assert '<script type="application/json" id="facet-index">[[0],[0]]</script>' in html
+
+
+def test_generate_html_no_facets_without_categories(minimal_config, sample_events):
+    for event in sample_events:
+        event.categories = []
+    html = generate_html(minimal_config, sample_events)
+    assert 'class="facet-options"' not in html
+
+
+def test_generate_html_no_service_worker_by_default(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    assert "serviceWorker" not in html
+
+
+def test_generate_html_service_worker_registration(minimal_config, sample_events):
+    minimal_config.output.service_worker = True
+    html = generate_html(minimal_config, sample_events)
+    assert "navigator.serviceWorker.register('sw.js')" in html
+
+
+def test_generate_service_worker_precache():
+    sw = generate_service_worker({"index.html": "<html></html>"})
+    assert 'var PRECACHE_URLS = ["./", "./index.html"];' in sw
+    assert "caches.delete" in sw
+
+
+def test_generate_service_worker_versioned_by_content():
+    first = generate_service_worker({"index.html": "v1"})
+    assert first == generate_service_worker({"index.html": "v1"})
+    assert first != generate_service_worker({"index.html": "v2"})
+
+
+def test_generate_service_worker_custom_page_name():
+    sw = generate_service_worker({"events.html": "<html></html>"})
+    assert 'var PRECACHE_URLS = ["./events.html"];' in sw
+
+
+def test_generate_html_event_end_timestamps(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    # All-day ends are floating: midnight after the last day
+    assert 'data-end="2026-03-02T00:00:00"' in html
+    assert 'data-end="2026-03-18T00:00:00"' in html
+
+
+def test_generate_html_month_separator_end(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    # Latest end in March, pinned to the last UTC instant it can occur
+    assert 'data-month="2026-03" data-end="2026-03-18T12:00:00+00:00"' in html
+
+
+def test_generate_html_valid_until(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    assert '<meta name="valid-until" content="2026-04-02T12:00:00+00:00">' in html
+
+
+def test_compute_valid_until_capped(minimal_config, sample_events):
+    minimal_config.filters.max_events = 3
+    valid_until = compute_valid_until(minimal_config, sample_events)
+    # First shown event ends at its earliest possible local midnight
+    assert valid_until == datetime(2026, 3, 1, 10, tzinfo=timezone.utc)
+
+
+def test_compute_valid_until_timed_event(minimal_config):
+    tz = timezone(timedelta(hours=-8))
+    event = TemplateEvent(
+        uid="timed",
+        summary="Timed",
+        start_date=date(2026, 3, 5),
+        start_datetime=datetime(2026, 3, 5, 18, tzinfo=tz),
+        end_datetime=datetime(2026, 3, 5, 20, tzinfo=tz),
+        is_all_day=False,
+        month_key="2026-03",
+    )
+    valid_until = compute_valid_until(minimal_config, [event])
+    assert valid_until == datetime(2026, 3, 6, 4, tzinfo=timezone.utc)
+
+
+def test_compute_valid_until_rolling_end_date(minimal_config):
+    event = TemplateEvent(
+        uid="later",
+        summary="Far Future",
+        start_date=date(2030, 6, 1),
+        is_all_day=True,
+        month_key="2030-06",
+    )
+    # Events past the default one-year window come into range tomorrow
+    tomorrow = datetime.combine(date.today() + timedelta(days=1), time())
+    valid_until = compute_valid_until(minimal_config, [event])
+    assert valid_until == tomorrow.astimezone(timezone.utc)
+
+    minimal_config.filters.end_date = date(2030, 12, 31)
+    valid_until = compute_valid_until(minimal_config, [event])
+    assert valid_until == datetime(2030, 6, 2, 12, tzinfo=timezone.utc)
+
+
+def test_compute_valid_until_no_events(minimal_config):
+    assert compute_valid_until(minimal_config, []) is None
+
+
+def test_generate_html_live_facet_counts(minimal_config, sample_events):
+    html = generate_html(minimal_config, sample_events)
+    assert "__updateFacetCounts" in html
+    assert '<span class="facet-count">1</span>' in html
@@ -0,0 +1,146 @@
+"""Tests for the event link checker, against a local stand-in server."""
+
+import json
+import threading
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from ical_events.links import check_event_links, check_links
+from ical_events.models import LinkCheckConfig, TemplateEvent
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    routes = {"/ok": 200, "/missing": 404, "/gone": 410}
+    requests: list[tuple[str, str]] = []
+
+    def do_HEAD(self):
+        self.requests.append(("HEAD", self.path))
+        if self.path == "/no-head":
+            self._reply(405)
+        else:
+            self._reply(self.routes.get(self.path, 404))
+
+    def do_GET(self):
+        self.requests.append(("GET", self.path))
+        self._reply(200 if self.path == "/no-head" else self.routes.get(self.path, 404))
+
+    def _reply(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in():
+    _StandInHandler.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    host, port = server.server_address[:2]
+    yield f"http://{host}:{port}"
+    server.shutdown()
+    thread.join()
+    server.server_close()
+
+
+@pytest.fixture
+def settings(tmp_path):
+    return LinkCheckConfig(cache_file=str(tmp_path / "links.json"), min_interval=0)
+
+
+def test_check_links_statuses(stand_in, settings):
+    results = check_links(
+        [f"{stand_in}/ok", f"{stand_in}/missing", f"{stand_in}/no-head"], settings
+    )
+    assert results[f"{stand_in}/ok"].ok
+    assert results[f"{stand_in}/missing"].status == 404
+    assert not results[f"{stand_in}/missing"].ok
+    assert results[f"{stand_in}/no-head"].ok
+
+
+def test_check_links_head_then_get(stand_in, settings):
+    check_links([f"{stand_in}/ok", f"{stand_in}/no-head"], settings)
+    assert ("GET", "/ok") not in _StandInHandler.requests
+    assert ("HEAD", "/no-head") in _StandInHandler.requests
+    assert ("GET", "/no-head") in _StandInHandler.requests
+
+
+def test_check_links_uses_cache(stand_in, settings):
+    check_links([f"{stand_in}/ok"], settings)
+    _StandInHandler.requests = []
+    results = check_links([f"{stand_in}/ok", f"{stand_in}/gone"], settings)
+    assert _StandInHandler.requests == [("HEAD", "/gone"), ("GET", "/gone")]
+    assert results[f"{stand_in}/ok"].ok
+
+
+def test_check_links_expired_cache(stand_in, settings):
+    check_links([f"{stand_in}/ok"], settings)
+    _StandInHandler.requests = []
+    settings.ttl_hours = 0
+    check_links([f"{stand_in}/ok"], settings)
+    assert _StandInHandler.requests == [("HEAD", "/ok")]
+
+
+def test_check_links_connection_error(settings):
+    results = check_links(["http://127.0.0.1:9/unreachable"], settings)
+    result = results["http://127.0.0.1:9/unreachable"]
+    assert not result.ok
+    assert result.status is None
+    assert result.error
+
+
+def test_check_links_malformed_urls(stand_in, settings):
+    bad_ipv6 = "http://[::1/x"
+    long_label = f"http://{'a' * 64}.example/"
+    results = check_links([bad_ipv6, long_label, f"{stand_in}/ok"], settings)
+    assert results[bad_ipv6].error == "ValueError"
+    assert results[long_label].error == "LocationParseError"
+    assert results[f"{stand_in}/ok"].ok
+    # The rest of the run still reaches the cache
+    cached = json.loads(open(settings.cache_file).read())
+    assert set(cached) == {bad_ipv6, long_label, f"{stand_in}/ok"}
+
+
+def test_check_links_skips_non_http(settings):
+    assert check_links(["mailto:someone@example.com"], settings) == {}
+
+
+def test_check_links_corrupt_cache(stand_in, settings, tmp_path):
+    (tmp_path / "links.json").write_text("not json")
+    results = check_links([f"{stand_in}/ok"], settings)
+    assert results[f"{stand_in}/ok"].ok
+    cached = json.loads((tmp_path / "links.json").read_text())
+    assert cached[f"{stand_in}/ok"]["ok"] is True
+
+
+def test_check_event_links_drop_broken(stand_in, settings, capsys):
+    events = [
+        TemplateEvent(
+            uid="a", summary="Fine", url=f"{stand_in}/ok", start_date=date(2026, 3, 1)
+        ),
+        TemplateEvent(
+            uid="b",
+            summary="Dead",
+            url=f"{stand_in}/missing",
+            start_date=date(2026, 3, 2),
+        ),
+        TemplateEvent(uid="c", summary="None", start_date=date(2026, 3, 3)),
+    ]
+    settings.drop_broken = True
+    assert check_event_links(events, settings) == 1
+    assert events[0].url == f"{stand_in}/ok"
+    assert events[1].url is None
+    assert 'Broken link in "Dead"' in capsys.readouterr().err
+
+
+def test_check_event_links_report_only(stand_in, settings):
+    event = TemplateEvent(
+        uid="b", summary="Dead", url=f"{stand_in}/missing", start_date=date(2026, 3, 2)
+    )
+    assert check_event_links([event], settings) == 1
+    assert event.url == f"{stand_in}/missing"
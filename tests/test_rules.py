@@ -0,0 +1,149 @@
+"""Tests for include/exclude rule filtering."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from ical_events import calendar
+from ical_events.calendar import parse_events
+from ical_events.models import FiltersConfig, RuleSet
+from ical_events.rules import compile_rules
+
+
+def _filters(**kwargs):
+    return FiltersConfig(
+        start_date=date(2024, 1, 1), end_date=date(2027, 12, 31), **kwargs
+    )
+
+
+def _uids(ics, filters):
+    return {e.uid for e in parse_events(ics, filters)}
+
+
+def test_compile_rules_none_when_unconfigured():
+    assert compile_rules(_filters()) is None
+
+
+def test_include_categories(sample_ics_content):
+    filters = _filters(include=RuleSet(categories=["tech", "SPRING"]))
+    assert _uids(sample_ics_content, filters) == {
+        "test-multiday-2@test",
+        "test-april-4@test",
+    }
+
+
+def test_exclude_categories(sample_ics_content):
+    filters = _filters(exclude=RuleSet(categories=["Conference"]))
+    assert "test-multiday-2@test" not in _uids(sample_ics_content, filters)
+    assert len(_uids(sample_ics_content, filters)) == 4
+
+
+def test_include_keywords_any_field(sample_ics_content):
+    # "april city" is only in LOCATION, "no url" only in DESCRIPTION
+    filters = _filters(include=RuleSet(keywords=["APRIL CITY", "no url"]))
+    assert _uids(sample_ics_content, filters) == {
+        "test-april-4@test",
+        "test-nourl-3@test",
+    }
+
+
+def test_keywords_are_literal(sample_ics_content):
+    filters = _filters(include=RuleSet(keywords=["Multi-Day."]))
+    assert _uids(sample_ics_content, filters) == set()
+
+
+def test_exclude_patterns(sample_ics_content):
+    filters = _filters(exclude=RuleSet(patterns=[r"^Past", r"Event$"]))
+    assert _uids(sample_ics_content, filters) == {
+        "test-multiday-2@test",
+        "test-nourl-3@test",
+    }
+
+
+def test_patterns_case_sensitive_by_default(sample_ics_content):
+    assert _uids(sample_ics_content, _filters(include=RuleSet(patterns=["^past"]))) == (
+        set()
+    )
+    filters = _filters(include=RuleSet(patterns=["(?i:^past)"]))
+    assert _uids(sample_ics_content, filters) == {"test-past-5@test"}
+
+
+def test_patterns_with_global_flags(sample_ics_content):
+    filters = _filters(include=RuleSet(patterns=["(?i)^past", "Conference$"]))
+    assert _uids(sample_ics_content, filters) == {
+        "test-past-5@test",
+        "test-multiday-2@test",
+    }
+
+
+def test_patterns_with_same_group_name(sample_ics_content):
+    filters = _filters(include=RuleSet(patterns=[r"(?P<w>Past)", r"(?P<w>April) Ci"]))
+    assert _uids(sample_ics_content, filters) == {
+        "test-past-5@test",
+        "test-april-4@test",
+    }
+
+
+def test_pattern_backreferences_stay_local(sample_ics_content):
+    # Merged, the second \1 would refer to the first pattern's group
+    filters = _filters(include=RuleSet(patterns=[r"(April) \1", r"(C)onvention \1"]))
+    assert _uids(sample_ics_content, filters) == {"test-multiday-2@test"}
+
+
+def test_exclude_wins_over_include(sample_ics_content):
+    filters = _filters(
+        include=RuleSet(categories=["Tech", "Spring"]),
+        exclude=RuleSet(keywords=["conference"]),
+    )
+    assert _uids(sample_ics_content, filters) == {"test-april-4@test"}
+
+
+def test_duration_limits(sample_ics_content):
+    filters = _filters(min_duration=timedelta(days=2))
+    assert _uids(sample_ics_content, filters) == {"test-multiday-2@test"}
+    filters = _filters(max_duration=timedelta(days=1))
+    assert "test-multiday-2@test" not in _uids(sample_ics_content, filters)
+    assert len(_uids(sample_ics_content, filters)) == 4
+
+
+DURATION_ICS = (
+    "BEGIN:VCALENDAR\r\n"
+    "VERSION:2.0\r\n"
+    "PRODID:-//Test//EN\r\n"
+    "BEGIN:VEVENT\r\n"
+    "UID:duration-1@test\r\n"
+    "DTSTAMP:20260101T000000Z\r\n"
+    "DTSTART:20260301T180000Z\r\n"
+    "DURATION:PT3H\r\n"
+    "SUMMARY:Evening Talk\r\n"
+    "END:VEVENT\r\n"
+    "END:VCALENDAR\r\n"
+)
+
+
+def test_duration_limits_use_duration_property():
+    filters = _filters(min_duration=timedelta(hours=1))
+    assert _uids(DURATION_ICS, filters) == {"duration-1@test"}
+    filters = _filters(max_duration=timedelta(hours=2))
+    assert _uids(DURATION_ICS, filters) == set()
+
+
+def test_duration_from_config_string():
+    filters = FiltersConfig.model_validate({"min_duration": "PT2H"})
+    assert filters.min_duration == timedelta(hours=2)
+
+
+def test_invalid_pattern_rejected():
+    with pytest.raises(ValueError):
+        RuleSet(patterns=["(unclosed"])
+
+
+def test_rejected_events_skip_conversion(sample_ics_content, monkeypatch):
+    hashed = []
+    original = calendar._make_anchor_id
+    monkeypatch.setattr(
+        calendar, "_make_anchor_id", lambda uid: hashed.append(uid) or original(uid)
+    )
+    filters = _filters(include=RuleSet(categories=["Spring"]))
+    parse_events(sample_ics_content, filters)
+    assert hashed == ["test-april-4@test"]
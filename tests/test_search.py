@@ -0,0 +1,113 @@
+"""Tests for the build-time search index."""
+
+from datetime import date
+
+import pytest
+
+from ical_events.models import TemplateEvent
+from ical_events.search import (
+    build_category_facets,
+    build_search_index,
+    search_index,
+    tokenize,
+)
+
+
+@pytest.fixture
+def indexed_events():
+    return [
+        TemplateEvent(
+            uid="ev1",
+            summary="PyCon Workshop",
+            description="Hands-on Python tutorials",
+            location="Los Angeles, CA",
+            start_date=date(2026, 3, 1),
+            categories=["Tech", "Python"],
+        ),
+        TemplateEvent(
+            uid="ev2",
+            summary="Café Meetup",
+            location="Pasadena, CA",
+            start_date=date(2026, 3, 15),
+        ),
+        TemplateEvent(
+            uid="ev3",
+            summary="Rust Conference",
+            description="Systems programming in Los Angeles",
+            start_date=date(2026, 4, 1),
+            categories=["Tech"],
+        ),
+    ]
+
+
+def test_tokenize_normalizes():
+    assert tokenize("Café-Meetup, LA 2026!") == ["cafe", "meetup", "la", "2026"]
+
+
+def test_tokenize_empty():
+    assert tokenize("  --  ") == []
+
+
+def test_build_search_index_sorted_tokens(indexed_events):
+    index = build_search_index(indexed_events)
+    assert index["tokens"] == sorted(index["tokens"])
+    assert len(index["tokens"]) == len(index["postings"])
+
+
+def test_build_search_index_delta_encoded(indexed_events):
+    index = build_search_index(indexed_events)
+    i = index["tokens"].index("angeles")
+    # Events 0 and 2 → first absolute, then gap of 2
+    assert index["postings"][i] == [0, 2]
+
+
+def test_build_search_index_covers_fields(indexed_events):
+    index = build_search_index(indexed_events)
+    for token in ["pycon", "tutorials", "pasadena", "python", "tech"]:
+        assert token in index["tokens"]
+
+
+def test_search_index_prefix(indexed_events):
+    index = build_search_index(indexed_events)
+    assert search_index(index, "conf") == [2]
+    assert search_index(index, "py") == [0]
+
+
+def test_search_index_intersection(indexed_events):
+    index = build_search_index(indexed_events)
+    assert search_index(index, "los") == [0, 2]
+    assert search_index(index, "los tech rust") == [2]
+    assert search_index(index, "pasadena tech") == []
+
+
+def test_search_index_accents(indexed_events):
+    index = build_search_index(indexed_events)
+    assert search_index(index, "CAFÉ") == [1]
+
+
+def test_search_index_empty_query(indexed_events):
+    index = build_search_index(indexed_events)
+    assert search_index(index, "") == []
+
+
+def test_build_search_index_no_events():
+    assert build_search_index([]) == {"tokens": [], "postings": []}
+
+
+def test_build_category_facets_counts(indexed_events):
+    facets = build_category_facets(indexed_events)
+    assert [(f["name"], f["count"]) for f in facets] == [("Tech", 2), ("Python", 1)]
+
+
+def test_build_category_facets_delta_encoded(indexed_events):
+    facets = build_category_facets(indexed_events)
+    tech = next(f for f in facets if f["name"] == "Tech")
+    # Events 0 and 2 → first absolute, then gap of 2
+    assert tech["ids"] == [0, 2]
+
+
+def test_build_category_facets_duplicate_category():
+    event = TemplateEvent(
+        uid="dup", summary="Dup", start_date=date(2026, 1, 1), categories=["A", "A"]
+    )
+    assert build_category_facets([event]) == [{"name": "A", "count": 1, "ids": [0]}]
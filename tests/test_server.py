@@ -0,0 +1,144 @@
+"""Tests for the embedded HTTP server."""
+
+import gzip
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date
+
+import pytest
+
+from ical_events.config import load_config
+from ical_events.models import FiltersConfig
+from ical_events.server import SiteServer, _accepts_gzip, _etag_matches
+
+
+@pytest.fixture
+def site(sample_config_path):
+    config = load_config(str(sample_config_path))
+    config.filters = FiltersConfig(
+        start_date=date(2026, 1, 1), end_date=date(2026, 12, 31)
+    )
+    server = SiteServer(config, port=0, refresh_interval=3600)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    thread.join()
+
+
+def _get(site, path="/", headers=None):
+    host, port = site.address
+    req = urllib.request.Request(f"http://{host}:{port}{path}", headers=headers or {})
+    try:
+        with urllib.request.urlopen(req) as resp:
+            return resp.status, resp.headers, resp.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.headers, e.read()
+
+
+def test_serve_page(site):
+    status, headers, body = _get(site)
+    assert status == 200
+    assert headers["Content-Type"] == "text/html; charset=utf-8"
+    assert headers["ETag"].startswith('"')
+    assert b"<!DOCTYPE html>" in body
+
+
+def test_serve_output_filename_alias(site):
+    status, _, body = _get(site, "/index.html")
+    assert status == 200
+    assert b"Test Events" in body
+
+
+def test_serve_not_found(site):
+    status, _, _ = _get(site, "/missing")
+    assert status == 404
+
+
+def test_serve_gzip(site):
+    status, headers, body = _get(site, headers={"Accept-Encoding": "gzip"})
+    assert status == 200
+    assert headers["Content-Encoding"] == "gzip"
+    assert headers["ETag"].endswith('-gzip"')
+    assert b"<!DOCTYPE html>" in gzip.decompress(body)
+
+
+def test_serve_not_modified(site):
+    _, headers, _ = _get(site)
+    status, _, body = _get(site, headers={"If-None-Match": headers["ETag"]})
+    assert status == 304
+    assert body == b""
+
+
+def test_refresh_swaps_snapshot(site):
+    before = site.snapshot
+    assert site.refresh() is True
+    assert site.snapshot is not before
+    assert site.snapshot.resources["/"].etag == before.resources["/"].etag
+
+
+def test_refresh_failure_keeps_snapshot(site):
+    before = site.snapshot
+    site.config.calendar = "/nonexistent/calendar.ics"
+    assert site.refresh() is False
+    assert site.snapshot is before
+    status, _, _ = _get(site)
+    assert status == 200
+
+
+def test_accepts_gzip():
+    assert _accepts_gzip("gzip, deflate, br")
+    assert _accepts_gzip("br;q=1.0, gzip;q=0.8")
+    assert not _accepts_gzip("gzip;q=0")
+    assert not _accepts_gzip("identity")
+
+
+def test_etag_matches():
+    assert _etag_matches('"abc"', '"abc"')
+    assert _etag_matches('W/"abc", "def"', '"abc"')
+    assert _etag_matches("*", '"abc"')
+    assert not _etag_matches('"def"', '"abc"')
+    assert not _etag_matches(None, '"abc"')
+
+
+def test_serve_service_worker(site):
+    assert _get(site, "/sw.js")[0] == 404
+    site.config.output.service_worker = True
+    site.refresh()
+    status, headers, body = _get(site, "/sw.js")
+    assert status == 200
+    assert headers["Content-Type"] == "text/javascript; charset=utf-8"
+    assert b"PRECACHE_URLS" in body
+
+
+def test_refresh_unexpected_error_keeps_snapshot(site, monkeypatch, capsys):
+    def explode(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("ical_events.server.build_snapshot", explode)
+    before = site.snapshot
+    assert site.refresh() is False
+    assert site.snapshot is before
+    assert "RuntimeError: boom" in capsys.readouterr().err
+
+
+def test_refresh_loop_survives_errors(site, monkeypatch):
+    calls = []
+
+    def explode(*args, **kwargs):
+        calls.append(1)
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr("ical_events.server.build_snapshot", explode)
+    site.refresh_interval = 0.01
+    site._stop.clear()
+    refresher = threading.Thread(target=site._refresh_loop, daemon=True)
+    refresher.start()
+    deadline = time.monotonic() + 2
+    while len(calls) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    site._stop.set()
+    refresher.join()
+    assert len(calls) >= 3